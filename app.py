@@ -1,4 +1,5 @@
 import json
+from hashlib import blake2b
 from typing import Union
 
 import numpy as np
@@ -22,7 +23,7 @@ from source.plotting import plot_animation_and_fitness
 from source.traveling_saleman_problem import tsp
 
 
-def update_highscore(score: float, key: int) -> float:
+def update_highscore(score: float, key: str) -> float:
     """Updates the highscore for a particular topology for all the different methods.
 
     Args:
@@ -33,7 +34,6 @@ def update_highscore(score: float, key: int) -> float:
         A float representing the highscore. Being it the score of the current solution or that from the storage.
     """
 
-    key = str(key)  # Key is a hash so convert to string
     storage = Storage()  # Initialise the storage
     try:
         old_score = float(storage.get(key, scope="entity").getvalue())
@@ -49,7 +49,7 @@ def update_highscore(score: float, key: int) -> float:
 
 
 @memoize  # Memoize because for the same input we don't need to run the algorithm again
-def run_tsp(params: Munch) -> Union[px.line, dict, int]:
+def run_tsp(params: Munch) -> Union[px.line, dict, str]:
     """Run the traveling salesman problem with the selected topology and method.
 
     Args:
@@ -73,8 +73,8 @@ def run_tsp(params: Munch) -> Union[px.line, dict, int]:
         seed = params.topology.seed
         cities = get_random_points(n, seed)
 
-    # Get key for saving the highscore using a hash of the current topology
-    key = hash(str(cities))
+    # Get key for saving the highscore using a hash of the current topology, stable across processes
+    key = blake2b(np.ascontiguousarray(cities).tobytes(), digest_size=8).hexdigest()
 
     # Parse the arguments
     fig, data = tsp(
@@ -1,4 +1,5 @@
 import json
+from functools import cache
 from pathlib import Path
 
 from viktor.parametrization import IsEqual
@@ -17,11 +18,19 @@ _method_options = [
     OptionListElement(0, "2-opt"),
     OptionListElement(1, "Genetic Algorithm"),
     OptionListElement(2, "Self-Organizing Maps"),
+    OptionListElement(3, "Lin-Kernighan"),
 ]
 
+
+@cache
+def _load_descriptions() -> dict:
+    """Read the descriptions of the fields, parsed only once per process."""
+    with open(Path(__file__).parent / "source" / "lib" / "descriptions.json") as json_file:
+        return json.load(json_file)
+
+
 # Use a json file with all the descriptions to not clutter this file
-with open(Path(__file__).parent / "source" / "lib" / "descriptions.json") as json_file:
-    descriptions = json.load(json_file)
+descriptions = _load_descriptions()
 
 
 class AppParametrization(Parametrization):
@@ -39,6 +48,7 @@ class AppParametrization(Parametrization):
     variables.text_two_opt = Text(descriptions["Two opt"], visible=IsEqual(Lookup("variables.method"), 0))
     variables.text_ga = Text(descriptions["Genetical algorithm"], visible=IsEqual(Lookup("variables.method"), 1))
     variables.text_som = Text(descriptions["Self-organizing maps"], visible=IsEqual(Lookup("variables.method"), 2))
+    variables.text_lk = Text(descriptions["Lin-Kernighan"], visible=IsEqual(Lookup("variables.method"), 3))
 
     # The method and its variables
     variables.method = OptionField("Method", options=_method_options, default=0)
@@ -75,7 +85,11 @@ class AppParametrization(Parametrization):
         "Generations",
         default=500,
         step=100,
-        visible=Or(IsEqual(Lookup("variables.method"), 1), IsEqual(Lookup("variables.method"), 2)),
+        visible=Or(
+            IsEqual(Lookup("variables.method"), 1),
+            IsEqual(Lookup("variables.method"), 2),
+            IsEqual(Lookup("variables.method"), 3),
+        ),
         description=descriptions["Generations"],
     )
     variables.learning_rate = NumberField(
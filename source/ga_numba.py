@@ -0,0 +1,196 @@
+import numpy as np
+from numba import njit
+from numba import prange
+
+
+@njit(cache=True)
+def _route_distance(dist_matrix: np.ndarray, route: np.ndarray) -> float:
+    """Calculate the distance of the route using the precomputed distances between the cities, ending at the path start.
+
+    Args:
+        dist_matrix: The distances between every pair of cities.
+        route: A solution as an array of city indices.
+
+    Returns:
+        The total distance the route takes.
+    """
+    distance = 0.0
+    previous = route[-1]
+    for city in route:
+        distance += dist_matrix[previous, city]
+        previous = city
+    return distance
+
+
+@njit(cache=True, parallel=True)
+def score_population(
+    population: np.ndarray, dist_matrix: np.ndarray, distances: np.ndarray, stale: np.ndarray
+) -> None:
+    """Calculate the distance of every changed route in the population, spreading the routes over all cores.
+
+    Args:
+        population: The population as ndarray(size=(popSize, n)), one route per row.
+        dist_matrix: The distances between every pair of cities.
+        distances: The distance of each route in the population, the stale entries are updated in place.
+        stale: Whether the distance of each route has to be calculated.
+    """
+    for idx in prange(population.shape[0]):
+        if stale[idx]:
+            distances[idx] = _route_distance(dist_matrix, population[idx])
+
+
+@njit(cache=True)
+def rank_routes(distances: np.ndarray) -> (np.ndarray, np.ndarray):
+    """Sort the routes of the population so that we can select the best.
+
+    Args:
+        distances: The distance of each route in the population.
+
+    Returns:
+        order: The indices of the routes from best to worst.
+        fitness: The fitness of the routes in that order.
+    """
+    order = np.argsort(distances)  # Shortest route, i.e. the fittest, first
+    return order, 1.0 / distances[order]
+
+
+@njit(cache=True)
+def selection(distances: np.ndarray, eliteSize: int, picks: np.ndarray) -> np.ndarray:
+    """Select the elite and fill the rest of the mating pool using a roulette wheel on the fitness.
+
+    Args:
+        distances: The distance of each route in the population.
+        eliteSize: The number of best routes that are always selected.
+        picks: Uniform random numbers in [0, 1), one for every spin of the roulette wheel.
+
+    Returns:
+        The indices of the selected routes.
+    """
+    order, fitness = rank_routes(distances)
+    cum = np.cumsum(fitness)
+    cum /= cum[-1]
+
+    return np.concatenate((order[:eliteSize], order[np.searchsorted(cum, picks)]))
+
+
+@njit(cache=True)
+def ordered_crossover(
+    parent1: np.ndarray,
+    parent2: np.ndarray,
+    startGene: int,
+    endGene: int,
+    child: np.ndarray,
+    seen: np.ndarray,
+) -> None:
+    """Write a child taking the genes startGene:endGene of parent1 and the remaining cities in the order of parent2.
+
+    Args:
+        parent1: A route.
+        parent2: A route.
+        startGene: First gene taken from parent1.
+        endGene: Gene after the last gene taken from parent1.
+        child: Buffer the child is written to.
+        seen: Scratch membership mask with one entry per city, all False. It is all False again on return.
+    """
+    length = 0
+    for i in range(startGene, endGene):
+        child[length] = parent1[i]
+        seen[parent1[i]] = True
+        length += 1
+
+    for city in parent2:
+        if not seen[city]:
+            child[length] = city
+            length += 1
+
+    # Only the genes of parent1 were marked, so unmark those instead of clearing the whole mask
+    for i in range(startGene, endGene):
+        seen[parent1[i]] = False
+
+
+@njit(cache=True)
+def breed_two_point(
+    parent1: np.ndarray, parent2: np.ndarray, genes: np.ndarray, child: np.ndarray, seen: np.ndarray
+) -> None:
+    """Combine different genes from two different parents using two-point crossover.
+
+    Args:
+        parent1: A route.
+        parent2: A route.
+        genes: The two random crossover points.
+        child: Buffer the child is written to.
+        seen: Scratch membership mask with one entry per city, all False.
+    """
+    ordered_crossover(parent1, parent2, min(genes[0], genes[1]), max(genes[0], genes[1]), child, seen)
+
+
+@njit(cache=True)
+def mutate_swap(individual: np.ndarray, mutate: np.ndarray, swapWith: np.ndarray) -> None:
+    """Mutate an individual in place by swapping the selected cities with a random other city.
+
+    Args:
+        individual: Single route to mutate.
+        mutate: Whether the city at each position is swapped.
+        swapWith: The random position each city is swapped with.
+    """
+    # Swap one pair at a time, a swap may involve a city moved by an earlier swap
+    for swapped in range(individual.shape[0]):
+        if mutate[swapped]:
+            city = individual[swapped]
+            individual[swapped] = individual[swapWith[swapped]]
+            individual[swapWith[swapped]] = city
+
+
+@njit(cache=True)
+def next_generation(
+    population: np.ndarray,
+    children: np.ndarray,
+    distances: np.ndarray,
+    children_distances: np.ndarray,
+    stale: np.ndarray,
+    eliteSize: int,
+    seen: np.ndarray,
+    picks: np.ndarray,
+    shuffle: np.ndarray,
+    genes: np.ndarray,
+    mutate: np.ndarray,
+    swapWith: np.ndarray,
+) -> None:
+    """Take steps to the next generation. Select, mate, breed and mutate.
+
+    The parents are read from the population by index and the children are written straight into a second buffer of
+    the same shape, so no intermediate mating pool is allocated. All random numbers of the generation are drawn up
+    front by the caller. Only the bred children are mutated, the elites keep the route of their parent, so its distance
+    is carried over and only the bred children are marked stale.
+
+    Args:
+        population: The population of the current generation, one route per row.
+        children: Buffer the population for the next generation is written to.
+        distances: The distance of each route in the population.
+        children_distances: Buffer the known distances of the next generation are written to.
+        stale: Buffer that marks the children whose distance still has to be calculated.
+        eliteSize: Size of the best routes we want to select.
+        seen: Scratch membership mask with one entry per city, all False.
+        picks: Uniform random numbers in [0, 1) for the roulette wheel, one per route that is not elite.
+        shuffle: Random permutation of the mating pool used to pair the parents.
+        genes: The two random crossover points for every child, ndarray(size=(popSize,2)).
+        mutate: Whether each city of each route is swapped, ndarray(size=(popSize,n)). The elite rows are ignored.
+        swapWith: The random position each city is swapped with, ndarray(size=(popSize,n)).
+    """
+    popSize = population.shape[0]
+    matingpool = selection(distances, eliteSize, picks)
+
+    for i in range(min(eliteSize, popSize)):
+        children[i] = population[matingpool[i]]
+    for i in range(popSize - eliteSize):
+        parent1 = population[matingpool[shuffle[i]]]
+        parent2 = population[matingpool[shuffle[popSize - i - 1]]]
+        breed_two_point(parent1, parent2, genes[i], children[eliteSize + i], seen)
+
+    for i in range(popSize):
+        stale[i] = i >= eliteSize
+        if stale[i]:
+            mutate_swap(children[i], mutate[i], swapWith[i])
+        else:
+            children_distances[i] = distances[matingpool[i]]  # The elites are kept unmutated
+
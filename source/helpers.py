@@ -1,17 +1,59 @@
 import numpy as np
+from scipy.spatial.distance import cdist
 
+MAX_FRAMES = 200  # The number of iterations that are recorded for the animation, besides the initial route
+NEIGHBOURS = 10  # The number of nearest neighbours a new edge of a route is searched for
 
-def path_distance(cities: np.ndarray, route: list = None) -> float:
-    """Calculate the euclidian distance in n-space of the route traversing cities, ending at the path start.
+
+def distance_matrix(cities: np.ndarray) -> np.ndarray:
+    """Calculate the euclidian distance between every pair of cities.
+
+    The distances are stored in single precision, which halves the memory the solvers read in their inner loops.
 
     Args:
         cities: The cities used in the problem.
-        route: A solution. If None the function sees the order of cities as the route.
+
+    Returns:
+        ndarray(size=(n,n), dtype=float32) containing the distance from city i to city j at [i, j].
+    """
+    return cdist(cities, cities, "euclidean").astype(np.float32)
+
+
+def route_distance(dist_matrix: np.ndarray, route: np.ndarray) -> float:
+    """Calculate the distance of the route using the precomputed distances between the cities, ending at the path start.
+
+    Args:
+        dist_matrix: The distances between every pair of cities.
+        route: A solution as an array of city indices.
 
     Returns:
         The total distance the route takes.
     """
-    if route is not None:  # Cities are not in the right order
-        return np.sum([np.linalg.norm(cities[route[p]] - cities[route[p - 1]]) for p in range(len(route))])
-    else:  # Cities are in the right order
-        return np.sum(np.linalg.norm(cities - np.roll(cities, 1, axis=0), axis=1))
+    return dist_matrix[route, np.roll(route, -1)].sum(dtype=np.float64)  # Sum in full precision
+
+
+def nearest_neighbours(dist_matrix: np.ndarray, k: int = NEIGHBOURS) -> np.ndarray:
+    """Get the nearest other cities of every city, the candidates for a new edge of a route.
+
+    Args:
+        dist_matrix: The distances between every pair of cities.
+        k: The number of neighbours of each city, capped at the number of other cities.
+
+    Returns:
+        ndarray(size=(n,k)) with the indices of the nearest neighbours of city i at [i], closest first.
+    """
+    distances = dist_matrix.copy()
+    np.fill_diagonal(distances, np.inf)  # A city sharing its coordinates with another could otherwise sort after it
+    return np.argsort(distances, axis=1)[:, : min(k, dist_matrix.shape[0] - 1)]
+
+
+def snapshot_stride(iterations: int) -> int:
+    """Get the number of iterations between two recorded routes, so a long run keeps at most MAX_FRAMES of them.
+
+    Args:
+        iterations: The total number of iterations of the run.
+
+    Returns:
+        Record the route of every iteration that is a multiple of this stride, and always the last one.
+    """
+    return max(1, -(-iterations // MAX_FRAMES))  # Round up, so there are never more than MAX_FRAMES
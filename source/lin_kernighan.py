@@ -0,0 +1,38 @@
+from typing import Union
+
+import numpy as np
+
+from .helpers import nearest_neighbours
+from .helpers import route_distance
+from .lin_kernighan_numba import lin_kernighan_pass
+
+_MAX_DEPTH = 5  # The maximum number of 2-opt moves in one chain, longer chains rarely pay for their extra reversals
+
+
+def lin_kernighan(dist_matrix: np.ndarray, max_iter: int) -> Union[list, list, list]:
+    """Lin-Kernighan heuristic adapted from https://en.wikipedia.org/wiki/Lin%E2%80%93Kernighan_heuristic
+
+    Args:
+        dist_matrix: The problem definition. The distances between every pair of cities.
+        max_iter: The maximum number of passes over all cities.
+
+    Returns:
+        routes: A list of routes.
+        iterations: The different iterations.
+        distances: The calculated distances for the best route of each iteration.
+    """
+    neighbours = nearest_neighbours(dist_matrix)
+
+    route = np.arange(dist_matrix.shape[0])  # Make an array of row numbers corresponding to cities.
+    routes = [route.copy()]
+    distances = [route_distance(dist_matrix, route)]  # Calculate the distance of the initial path.
+    i = 0
+    iterations = [i]
+    improved = True
+    while improved and i < max_iter:  # If the route is still improving, keep going!
+        i += 1
+        improved = lin_kernighan_pass(dist_matrix, route, neighbours, _MAX_DEPTH) > 0
+        routes.append(route.copy())  # The route is updated in place, so store a snapshot.
+        iterations.append(i)
+        distances.append(route_distance(dist_matrix, route))
+    return routes, iterations, distances
@@ -0,0 +1,127 @@
+import numpy as np
+from numba import njit
+
+from .route_numba import reverse_segment
+from .route_numba import route_positions
+
+_EPSILON = 1e-9  # Smallest gain that counts as an improvement, anything smaller is rounding noise
+
+
+@njit(cache=True)
+def _step(
+    route: np.ndarray,
+    pos: np.ndarray,
+    t2: int,
+    t3: int,
+    direction: int,
+    firsts: np.ndarray,
+    lasts: np.ndarray,
+    depth: int,
+) -> (int, int):
+    """Apply one 2-opt move of the chain: swap the edges t1-t2 and t4-t3 for t1-t4 and t2-t3.
+
+    The move reverses either the path t2..t4 or the rest of the route t3..t1, whichever is shorter. Both give the same
+    tour, but reversing the rest turns the route around, so the direction of the chain flips.
+
+    Args:
+        route: The route as an array of city indices.
+        pos: The position of every city in the route, kept up to date.
+        t2: The city after t1 in the direction of the chain.
+        t3: The city that gets connected to t2.
+        direction: 1 if t2 follows t1 in the route, -1 if it precedes it.
+        firsts: The first positions of the reversals of the chain, to roll them back.
+        lasts: The last positions of the reversals of the chain.
+        depth: The number of moves in the chain so far.
+
+    Returns:
+        t4: The city that is connected to t1 and is the next t2 of the chain.
+        direction: The direction of the chain after the move.
+    """
+    n = route.shape[0]
+    t4 = route[(pos[t3] - direction) % n]
+    first, last = (pos[t2], pos[t4]) if direction == 1 else (pos[t4], pos[t2])
+    if (last - first) % n >= n // 2:
+        first, last = (last + 1) % n, (first - 1) % n
+        direction = -direction
+    firsts[depth] = first
+    lasts[depth] = last
+    reverse_segment(route, pos, first, last)
+    return t4, direction
+
+
+@njit(cache=True)
+def _is_candidate(route: np.ndarray, pos: np.ndarray, t1: int, t2: int, t3: int, direction: int) -> bool:
+    """Whether t3 can be connected to t2 without undoing the edge t1-t2 or the edge t2-t3 already in the route."""
+    return t3 != t1 and t3 != t2 and t3 != route[(pos[t2] + direction) % route.shape[0]]
+
+
+@njit(cache=True)
+def lin_kernighan_pass(dist_matrix: np.ndarray, route: np.ndarray, neighbours: np.ndarray, max_depth: int) -> float:
+    """Try a Lin-Kernighan move from every city in both directions, updating the route in place.
+
+    A move breaks the edge t1-t2 and grows a chain of 2-opt moves: add the edge t2-t3 to one of the nearest neighbours
+    of t2, break the edge t3-t4 and close the tour with t4-t1. The chain continues from t4 as the new t2 as long as the
+    gain without the closing edge stays positive, and the tour is rolled back to the best closed tour of the chain.
+    Every neighbour is tried as the first t3, deeper in the chain only the most promising one is followed.
+
+    Args:
+        dist_matrix: The distances between every pair of cities.
+        route: The route as an array of city indices.
+        neighbours: The nearest neighbours of every city, closest first.
+        max_depth: The maximum number of 2-opt moves in one chain.
+
+    Returns:
+        The total decrease of the route distance.
+    """
+    n = route.shape[0]
+    pos = route_positions(route)
+    firsts = np.empty(max_depth, dtype=np.int64)
+    lasts = np.empty(max_depth, dtype=np.int64)
+
+    total_gain = 0.0
+    for t1 in range(n):
+        for direction in (1, -1):
+            start = route[(pos[t1] + direction) % n]
+            for first_t3 in neighbours[start]:
+                if dist_matrix[t1, start] - dist_matrix[start, first_t3] <= 0:
+                    break  # The neighbours are sorted, so none of the others has a positive gain either
+                if not _is_candidate(route, pos, t1, start, first_t3, direction):
+                    continue
+
+                t2 = start
+                t3 = first_t3
+                chain_direction = direction
+                gain = np.float64(dist_matrix[t1, t2])  # Add up in double precision, so rounding never counts as gain
+                best_gain = _EPSILON
+                best_depth = 0
+                depth = 0
+                while t3 >= 0 and depth < max_depth:
+                    t4, chain_direction = _step(route, pos, t2, t3, chain_direction, firsts, lasts, depth)
+                    depth += 1
+                    gain = gain + dist_matrix[t3, t4] - dist_matrix[t2, t3]
+                    if gain - dist_matrix[t4, t1] > best_gain:
+                        best_gain = gain - dist_matrix[t4, t1]
+                        best_depth = depth
+                    t2 = t4
+
+                    # Continue with the neighbour that leaves the longest edge t3-t4 to break for the shortest t2-t3
+                    t3 = -1
+                    best_score = -np.inf
+                    for candidate in neighbours[t2]:
+                        if gain - dist_matrix[t2, candidate] <= 0:
+                            break
+                        if not _is_candidate(route, pos, t1, t2, candidate, chain_direction):
+                            continue
+                        t4 = route[(pos[candidate] - chain_direction) % n]
+                        score = dist_matrix[candidate, t4] - dist_matrix[t2, candidate]
+                        if score > best_score:
+                            best_score = score
+                            t3 = candidate
+
+                # Roll back the moves made after the best closed tour
+                for step in range(depth - 1, best_depth - 1, -1):
+                    reverse_segment(route, pos, firsts[step], lasts[step])
+                if best_depth > 0:
+                    total_gain += best_gain
+                    break  # The route around t1 changed, continue with the other direction
+    return total_gain
@@ -1,8 +1,10 @@
+from numpy import arange
 from numpy import cos
 from numpy import ndarray
 from numpy import pi
 from numpy import random
 from numpy import sin
+from numpy import stack
 
 
 def get_circle_points(radius: int, n: int) -> ndarray:
@@ -15,10 +17,8 @@ def get_circle_points(radius: int, n: int) -> ndarray:
     Returns:
         A ndarray with cities with two coordinates.
     """
-    points = ndarray(shape=(n, 2))
-    for x, point in enumerate(points):
-        point[0] = cos(2 * pi / n * x) * radius
-        point[1] = sin(2 * pi / n * x) * radius
+    angles = 2 * pi / n * arange(n)
+    points = stack((cos(angles) * radius, sin(angles) * radius), axis=1)
 
     # Shuffle the points so the initial route is not the perfect one
     random.RandomState(n).shuffle(points)
@@ -1,25 +1,28 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 
-def create_animation(new_cities_orders: list) -> px.line:
+def create_animation(new_cities_orders: np.ndarray, routes: np.ndarray) -> px.line:
     """Creates an animation of the different routes found over different generations.
 
     Args:
-        new_cities_orders: A list containing city lists in the order of the route taken.
+        new_cities_orders: The cities in the order of the route taken for every frame as ndarray(size=(frames,n,2)).
+        routes: The index of each of those cities as ndarray(size=(frames,n)), so every city keeps its marker between
+            the frames and only the edges of the route change.
 
     Returns:
         A plotly figure with animation frames.
     """
-    data = {"x": [], "y": [], "frame": [], "city": []}
-    for frame, new_cities_order in enumerate(new_cities_orders):
-        for city in new_cities_order:
-            data["x"].append(city[0])
-            data["y"].append(city[1])
-            data["frame"].append(frame)
-            data["city"].append(city)
+    frames, n = new_cities_orders.shape[:2]
+    data = {
+        "x": new_cities_orders[..., 0].ravel(),
+        "y": new_cities_orders[..., 1].ravel(),
+        "frame": np.repeat(np.arange(frames), n),
+        "city": routes.ravel(),
+    }
     df = pd.DataFrame(data=data)
 
     fig = px.line(df, x="x", y="y", animation_frame="frame", markers=True, animation_group="city")
@@ -0,0 +1,41 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def route_positions(route: np.ndarray) -> np.ndarray:
+    """Get the position of every city in the route.
+
+    Args:
+        route: The route as an array of city indices.
+
+    Returns:
+        The position in the route of each city, so that route[positions[city]] == city.
+    """
+    positions = np.empty(route.shape[0], dtype=np.int64)
+    for i in range(route.shape[0]):
+        positions[route[i]] = i
+    return positions
+
+
+@njit(cache=True)
+def reverse_segment(route: np.ndarray, pos: np.ndarray, first: int, last: int) -> None:
+    """Reverse the route from position first up to and including position last, wrapping around the end.
+
+    Args:
+        route: The route as an array of city indices.
+        pos: The position of every city in the route, kept up to date.
+        first: The first position of the segment.
+        last: The last position of the segment.
+    """
+    n = route.shape[0]
+    length = (last - first) % n + 1
+    for step in range(length // 2):
+        i = (first + step) % n
+        k = (last - step) % n
+        city_i = route[i]
+        city_k = route[k]
+        route[i] = city_k
+        pos[city_k] = i
+        route[k] = city_i
+        pos[city_i] = k
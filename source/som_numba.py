@@ -0,0 +1,38 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def som_step(
+    network: np.ndarray, city: np.ndarray, network_distances: np.ndarray, radix: float, learning_rate: float
+) -> None:
+    """Move the neuron closest to the city and its neighbourhood towards the city, updating the network in place.
+
+    Args:
+        network: The neuron network as ndarray(size=(n,2)).
+        city: The normalized x and y coordinate of the city.
+        network_distances: The squared circular distances between the neurons of the network.
+        radix: The radius of the gaussian neighbourhood around the winning neuron.
+        learning_rate: The fraction of the distance to the city that the winning neuron moves.
+    """
+    # Select the neuron closest to the city, starting from the first neuron as fastmath assumes no infinities
+    winner_idx = 0
+    best = (network[0, 0] - city[0]) ** 2 + (network[0, 1] - city[1]) ** 2
+    for idx in range(1, network.shape[0]):
+        dx = network[idx, 0] - city[0]
+        dy = network[idx, 1] - city[1]
+        distance = dx * dx + dy * dy
+        if distance < best:
+            best = distance
+            winner_idx = idx
+
+    # Impose an upper bound on the radix to prevent NaN and blocks
+    if radix < 1:
+        radix = 1
+
+    # Move the neurons closer to the city, weighted by the gaussian around the winner
+    spread = 2 * (radix * radix)
+    for idx in range(network.shape[0]):
+        weight = np.exp(-network_distances[winner_idx, idx] / spread) * learning_rate
+        network[idx, 0] += weight * (city[0] - network[idx, 0])
+        network[idx, 1] += weight * (city[1] - network[idx, 1])
@@ -1,9 +1,13 @@
 from enum import Enum
+from typing import Callable
+from typing import Dict
 from typing import Union
 
 import numpy as np
 
 from .geneticalgorithm import geneticAlgorithm
+from .helpers import distance_matrix
+from .lin_kernighan import lin_kernighan
 from .plotting import create_animation
 from .self_organizing_maps import self_organizing_maps
 from .two_opt import two_opt
@@ -13,6 +17,20 @@ class Method(Enum):
     two_opt = 0
     GA = 1
     SOM = 2
+    LK = 3
+
+
+# The solver of every method, each taking the parameters it uses by keyword and ignoring the rest
+_DISPATCH: Dict[Method, Callable] = {
+    Method.two_opt: lambda cities, dist_matrix, improvement_threshold, **_: two_opt(dist_matrix, improvement_threshold),
+    Method.GA: lambda cities, dist_matrix, popSize, eliteSize, mutationRate, generations, **_: geneticAlgorithm(
+        dist_matrix, popSize, eliteSize, mutationRate, generations
+    ),
+    Method.SOM: lambda cities, dist_matrix, generations, learning_rate, popSize, decay, **_: self_organizing_maps(
+        cities, dist_matrix, generations, learning_rate, popSize, decay
+    ),
+    Method.LK: lambda cities, dist_matrix, generations, **_: lin_kernighan(dist_matrix, generations),
+}
 
 
 def tsp(
@@ -35,7 +53,8 @@ def tsp(
         popSize: Population size for evolutionary algorithms.
         eliteSize: The selection size for evolutionary algorithms.
         mutationRate: Mutation rate for evolutionary algorithms.
-        generations: The number of generations an evolutionary algorithm must go through.
+        generations: The number of generations an evolutionary algorithm must go through, or the maximum number of
+            passes of Lin-Kernighan.
         learning_rate: Displacement of the neurons to search a route.
         decay: Decays the learning rate so we get less aggressive searches over time.
 
@@ -45,27 +64,34 @@ def tsp(
     """
 
     # If method is an int change to Enum
-    if type(method) == int:
+    if isinstance(method, int):
         method = Method(method)
-
-    # Select the correct method
-    if method == Method.two_opt:
-        routes, i, distance = two_opt(cities, improvement_threshold)
-    elif method == Method.GA:
-        routes, i, distance = geneticAlgorithm(cities, popSize, eliteSize, mutationRate, generations)
-    elif method == Method.SOM:
-        routes, i, distance = self_organizing_maps(cities, generations, learning_rate, popSize, decay)
-    else:
+    if method not in _DISPATCH:
         raise NotImplementedError(f"Method {method.name} not implemented.")
 
+    # Calculate the distances between the cities once, so every method only has to look them up
+    dist_matrix = distance_matrix(cities)
+
+    # Run the selected method
+    routes, i, distance = _DISPATCH[method](
+        cities,
+        dist_matrix,
+        improvement_threshold=improvement_threshold,
+        popSize=popSize,
+        eliteSize=eliteSize,
+        mutationRate=mutationRate,
+        generations=generations,
+        learning_rate=learning_rate,
+        decay=decay,
+    )
+
     # Reorder the cities matrix by route order in a new matrix for plotting.
-    new_cities_orders = [
-        np.concatenate((np.array([cities[route[i]] for i in range(len(route))]), np.array([cities[route[0]]])))
-        for route in routes
-    ]
+    routes = np.array(routes)
+    routes = np.column_stack((routes, routes[:, 0]))  # Close every route at its first city
+    new_cities_orders = cities[routes]
 
     # Create figure for plotly view
-    fig = create_animation(new_cities_orders)
+    fig = create_animation(new_cities_orders, routes)
 
     # Create data for data view
     data = {"Max iteration": i, "Calculated distance": distance}
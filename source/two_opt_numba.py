@@ -0,0 +1,49 @@
+import numpy as np
+from numba import njit
+
+from .route_numba import reverse_segment
+from .route_numba import route_positions
+
+
+@njit(cache=True)
+def two_opt_pass(dist_matrix: np.ndarray, route: np.ndarray, neighbours: np.ndarray) -> float:
+    """Try a 2-opt move from every city in both directions and keep each one that shortens the route, in place.
+
+    A move replaces the edges t1-t2 and t3-t4 by t1-t3 and t2-t4 by reversing the path t2..t3, so it is judged on those
+    four distances only. The new edge t1-t3 is only searched among the nearest neighbours of t1: a move can only be an
+    improvement if t1-t3 or t2-t4 is shorter than the edge it replaces, and the move from the other end covers the
+    latter.
+
+    Args:
+        dist_matrix: The distances between every pair of cities.
+        route: The route as an array of city indices.
+        neighbours: The nearest neighbours of every city, closest first.
+
+    Returns:
+        The total decrease of the route distance.
+    """
+    n = route.shape[0]
+    pos = route_positions(route)
+
+    total_gain = 0.0
+    for t1 in range(n):
+        for direction in (1, -1):
+            t2 = route[(pos[t1] + direction) % n]
+            for t3 in neighbours[t1]:
+                if dist_matrix[t1, t3] >= dist_matrix[t1, t2]:
+                    break  # The neighbours are sorted, so none of the others is shorter either
+                t4 = route[(pos[t3] + direction) % n]
+                if t3 == t1 or t3 == t2 or t4 == t1:
+                    continue
+                # Add up in double precision, so rounding never makes a move look like an improvement
+                removed = np.float64(dist_matrix[t1, t2]) + dist_matrix[t3, t4]
+                added = np.float64(dist_matrix[t1, t3]) + dist_matrix[t2, t4]
+                if added < removed:
+                    # The path distance is an improvement, reverse t2..t3 or the rest of the route, whichever is shorter
+                    first, last = (pos[t2], pos[t3]) if direction == 1 else (pos[t3], pos[t2])
+                    if (last - first) % n >= n // 2:
+                        first, last = (last + 1) % n, (first - 1) % n
+                    reverse_segment(route, pos, first, last)
+                    total_gain += removed - added
+                    break  # The route around t1 changed, continue with the other direction
+    return total_gain
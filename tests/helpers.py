@@ -0,0 +1,22 @@
+import numpy as np
+
+from source.helpers import distance_matrix
+from source.helpers import nearest_neighbours
+
+
+def random_instances(seed: int = 0):
+    """Generate random problems of a few sizes, each once with unique cities and once with cities sharing coordinates.
+
+    Args:
+        seed: The seed of the random generator.
+
+    Returns:
+        A generator of (dist_matrix, neighbours, route) with a random route through the cities.
+    """
+    rng = np.random.default_rng(seed)
+    for n in (4, 5, 10, 50):
+        for duplicates in (0, n // 2):
+            cities = rng.random((n, 2))
+            cities[:duplicates] = cities[rng.integers(duplicates, n, duplicates)]  # Cities sharing coordinates
+            dist_matrix = distance_matrix(cities)
+            yield dist_matrix, nearest_neighbours(dist_matrix), rng.permutation(n)
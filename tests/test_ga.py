@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from source.ga_numba import next_generation
+from source.ga_numba import score_population
+from source.helpers import distance_matrix
+from source.helpers import route_distance
+
+
+class TestNextGeneration(unittest.TestCase):
+    def test_population_and_distances_stay_consistent(self):
+        rng = np.random.default_rng(0)
+        popSize, eliteSize, mutationRate, n = 20, 5, 0.05, 30
+        dist_matrix = distance_matrix(rng.random((n, 2)))
+
+        pop = rng.permuted(np.tile(np.arange(n, dtype=np.int32), (popSize, 1)), axis=1)
+        children = np.empty_like(pop)
+        pop_distances = np.empty(popSize)
+        children_distances = np.empty(popSize)
+        stale = np.ones(popSize, dtype=np.bool_)
+        seen = np.zeros(n, dtype=np.bool_)
+        score_population(pop, dist_matrix, pop_distances, stale)
+        for _ in range(300):
+            next_generation(
+                pop,
+                children,
+                pop_distances,
+                children_distances,
+                stale,
+                eliteSize,
+                seen,
+                rng.random(popSize - eliteSize),
+                rng.permutation(popSize),
+                rng.integers(0, n, (popSize, 2)),
+                rng.random((popSize, n)) < mutationRate,
+                rng.integers(0, n, (popSize, n)),
+            )
+            pop, children = children, pop
+            pop_distances, children_distances = children_distances, pop_distances
+            score_population(pop, dist_matrix, pop_distances, stale)
+
+            for route, distance in zip(pop, pop_distances):
+                self.assertCountEqual(route, range(n))
+                self.assertAlmostEqual(distance, route_distance(dist_matrix, route))
+            self.assertFalse(seen.any())
+
+
+if __name__ == "__main__":
+    unittest.main()
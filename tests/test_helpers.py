@@ -0,0 +1,22 @@
+import unittest
+
+import numpy as np
+
+from source.helpers import distance_matrix
+from source.helpers import nearest_neighbours
+
+
+class TestNearestNeighbours(unittest.TestCase):
+    def test_excludes_the_city_itself(self):
+        cities = np.array([[0, 0], [3, 0], [3, 0], [0, 4], [0, 0], [1, 1]])
+
+        neighbours = nearest_neighbours(distance_matrix(cities))
+
+        self.assertEqual(neighbours.shape, (6, 5))
+        for city, row in enumerate(neighbours):
+            self.assertNotIn(city, row)
+        self.assertEqual(neighbours[0, 0], 4)  # The other city at the same coordinates is the nearest
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from source.helpers import route_distance
+from source.lin_kernighan_numba import lin_kernighan_pass
+from tests.helpers import random_instances
+
+
+class TestLinKernighan(unittest.TestCase):
+    def test_pass_gain_is_decrease_of_route_distance(self):
+        for dist_matrix, neighbours, route in random_instances():
+            n = route.shape[0]
+            before = route_distance(dist_matrix, route)
+            gain = lin_kernighan_pass(dist_matrix, route, neighbours, n)
+
+            self.assertCountEqual(route, range(n))
+            self.assertAlmostEqual(gain, before - route_distance(dist_matrix, route))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+
+from source.helpers import distance_matrix
+from source.helpers import route_distance
+from source.two_opt import two_opt
+from source.two_opt_numba import two_opt_pass
+from tests.helpers import random_instances
+
+
+class TestTwoOpt(unittest.TestCase):
+    def test_pass_gain_is_decrease_of_route_distance(self):
+        for dist_matrix, neighbours, route in random_instances():
+            n = route.shape[0]
+            before = route_distance(dist_matrix, route)
+            gain = two_opt_pass(dist_matrix, route, neighbours)
+
+            self.assertCountEqual(route, range(n))
+            self.assertAlmostEqual(gain, before - route_distance(dist_matrix, route))
+
+    def test_distances_with_duplicate_cities(self):
+        cities = np.array([[0, 0], [3, 0], [3, 0], [0, 4], [0, 0], [1, 1]])
+        dist_matrix = distance_matrix(cities)
+
+        routes, iterations, distances = two_opt(dist_matrix, 0.001)
+
+        for route, distance in zip(routes, distances):
+            self.assertAlmostEqual(distance, route_distance(dist_matrix, route))
+        self.assertLessEqual(distances[-1], distances[0])
+
+
+if __name__ == "__main__":
+    unittest.main()